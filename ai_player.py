@@ -1,17 +1,108 @@
 import random
-from typing import Tuple, Optional
+from typing import List, NamedTuple, Tuple, Optional
 from game_logic import TicTacToeGame # Import the game logic class
 
+
+class TTEntry(NamedTuple):
+    """A stored search result for one position."""
+    depth: int
+    value: float
+    best_move: Optional[Tuple[int, int]]
+
+
+class TranspositionTable:
+    """
+    A bounded cache of search results keyed by the game's Zobrist hash.
+    Each position maps to a two-slot bucket: a depth-preferred slot that keeps
+    the deepest result seen for the bucket, and an always-replace slot for the
+    most recent shallower one. A full table therefore evicts one entry per put
+    and never scans or copies the rest.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        """
+        Initializes an empty table.
+        Args:
+            capacity (int): Maximum number of positions to keep (rounded down to an
+                            even number of slots, minimum 2). Both slot lists
+                            are allocated up front, about 16 bytes per slot.
+        """
+        self._buckets = max(1, capacity // 2)
+        self.capacity = self._buckets * 2
+        # Slot 2 * b is bucket b's depth-preferred slot, 2 * b + 1 its always-replace slot
+        self._keys: List[Optional[int]] = [None] * self.capacity
+        self._entries: List[Optional[TTEntry]] = [None] * self.capacity
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, key: int) -> Optional[TTEntry]:
+        """Returns the stored entry for the position hash, or None if absent."""
+        slot = (key % self._buckets) * 2
+        if self._keys[slot] == key:
+            return self._entries[slot]
+        if self._keys[slot + 1] == key:
+            return self._entries[slot + 1]
+        return None
+
+    def put(self, key: int, depth: int, value: float, best_move: Optional[Tuple[int, int]]):
+        """
+        Stores a search result, replacing any shallower entry for the same position.
+        Args:
+            key (int): Zobrist hash of the position (see TicTacToeGame.get_zobrist).
+            depth (int): Search depth the result was computed at.
+            value (float): Evaluation of the position.
+            best_move (Optional[Tuple[int, int]]): Best move found, if any.
+        """
+        entry = TTEntry(depth, value, best_move)
+        deep = (key % self._buckets) * 2
+        recent = deep + 1
+        if self._keys[deep] == key:
+            if self._entries[deep].depth <= depth:
+                self._entries[deep] = entry
+            return
+        if self._keys[recent] == key:
+            if self._entries[recent].depth > depth:
+                return  # Keep the deeper result for this position
+            self._keys[recent] = self._entries[recent] = None
+            self._size -= 1
+        kept = self._entries[deep]
+        if kept is None or kept.depth <= depth:
+            if kept is not None:
+                # Demote the displaced result rather than dropping it
+                self._store(recent, self._keys[deep], kept)
+            self._store(deep, key, entry)
+        else:
+            self._store(recent, key, entry)
+
+    def _store(self, slot: int, key: int, entry: TTEntry):
+        """Writes an entry into a slot, overwriting whatever it held."""
+        if self._keys[slot] is None:
+            self._size += 1
+        self._keys[slot] = key
+        self._entries[slot] = entry
+
+    def clear(self):
+        self._keys[:] = [None] * self.capacity
+        self._entries[:] = [None] * self.capacity
+        self._size = 0
+
+
 class RandomAIPlayer:
     """An AI player that chooses a random valid move."""
 
-    def __init__(self, player_symbol: str):
+    def __init__(self, player_symbol: str, transposition_table: Optional[TranspositionTable] = None):
         """
         Initializes the AI player.
         Args:
             player_symbol (str): The symbol this AI uses ('X' or 'O').
+            transposition_table (Optional[TranspositionTable]): Cache of earlier
+                move choices keyed by position; if given, a position seen before
+                replays its stored move.
         """
         self.player_symbol = player_symbol
+        self.tt = transposition_table
         print(f"Random AI initialized as Player {player_symbol}")
 
     def get_move(self, game: TicTacToeGame) -> Optional[Tuple[int, int]]:
@@ -23,10 +114,30 @@ class RandomAIPlayer:
             Optional[Tuple[int, int]]: A tuple (row, col) representing the chosen move,
                                        or None if no valid moves are available (should not happen if called correctly).
         """
-        valid_moves = game.get_valid_moves()
-        if not valid_moves:
+        if self.tt is not None:
+            entry = self.tt.get(game.get_zobrist())
+            if entry is not None and entry.best_move is not None:
+                return entry.best_move
+
+        # Sample straight from the empty-cell bitboard instead of building the move list
+        empty = game.get_empty_bits()
+        if not empty:
             return None # No moves left
 
-        chosen_move = random.choice(valid_moves)
+        size = game.board_size
+        n_empty = bin(empty).count("1")  # int.bit_count needs Python 3.10
+        if n_empty * 2 > size * size:
+            # Mostly empty board: rejection sampling hits an empty cell within ~2 tries
+            idx = random.randrange(size * size)
+            while not (empty >> idx) & 1:
+                idx = random.randrange(size * size)
+        else:
+            # Clear the k lowest set bits, then take the next one
+            for _ in range(random.randrange(n_empty)):
+                empty &= empty - 1
+            idx = (empty & -empty).bit_length() - 1
+        chosen_move = divmod(idx, size)
+        if self.tt is not None:
+            self.tt.put(game.get_zobrist(), 0, 0.0, chosen_move) # Depth 0: no search behind it
         # print(f"AI ({self.player_symbol}) chose move: {chosen_move}") # Optional debug print
         return chosen_move
@@ -0,0 +1,128 @@
+import numpy as np
+
+from game_logic import BOARD_SIZE, WIN_LENGTH
+
+# Player indices used along axis 1 of BatchTicTacToe.boards
+PLAYER_X = 0
+PLAYER_O = 1
+NO_WINNER = -1
+
+_FULL_ROW = (1 << BOARD_SIZE) - 1
+
+
+def _run_steps(length: int) -> tuple:
+    """
+    Shift distances that grow a run of 1 cell to `length` cells by doubling,
+    e.g. (1, 2, 1) for 5: 1 -> 2 -> 4 -> 5 cells in three steps instead of four.
+    """
+    steps = []
+    run = 1
+    while run < length:
+        step = min(run, length - run)
+        steps.append(step)
+        run += step
+    return tuple(steps)
+
+
+# WIN_LENGTH is fixed at import, so the step schedule is computed once
+_RUN_STEPS = _run_steps(WIN_LENGTH)
+
+
+def check_wins(bbs: np.ndarray) -> np.ndarray:
+    """
+    Checks a stack of single-player bitboards for WIN_LENGTH in a row.
+    Args:
+        bbs (np.ndarray): uint16 array of shape (..., BOARD_SIZE); element [..., r]
+                          has bit c set if the player owns cell (r, c).
+    Returns:
+        np.ndarray: bool array of shape (...), True where the board contains a win.
+    """
+    # Rows first, so each row slice below is one contiguous block of games
+    rows = np.ascontiguousarray(np.moveaxis(bbs, -1, 0))
+    # After each step, bit c of element [r, ...] marks a run starting at (r, c)
+    horizontal = rows.copy()
+    vertical = diagonal = anti_diagonal = rows
+    for step in _RUN_STEPS:
+        np.bitwise_and(horizontal, horizontal >> step, out=horizontal)  # (r, c + step)
+        vertical = vertical[:-step] & vertical[step:]  # (r + step, c)
+        diagonal = diagonal[:-step] & (diagonal[step:] >> step)  # (r + step, c + step)
+        anti_diagonal = anti_diagonal[:-step] & (anti_diagonal[step:] << step)  # (r + step, c - step)
+    # Bits the anti-diagonal shifts past column BOARD_SIZE - 1 are cleared by the
+    # AND with the unshifted term, which never has them set
+    found = np.bitwise_or.reduce(horizontal, axis=0)
+    found |= np.bitwise_or.reduce(vertical, axis=0)
+    found |= np.bitwise_or.reduce(diagonal, axis=0)
+    found |= np.bitwise_or.reduce(anti_diagonal, axis=0)
+    return found != 0
+
+
+class BatchTicTacToe:
+    """
+    Runs many independent games in lockstep for self-play / RL training.
+    State is kept as struct-of-arrays: one row-bitboard array for all games plus
+    per-game player/winner/game_over vectors, so a ply for every game is a
+    handful of numpy operations instead of one make_move call per game.
+    """
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.board_size = BOARD_SIZE
+        self.win_length = WIN_LENGTH
+        self.reset()
+
+    def reset(self) -> np.ndarray:
+        """Resets every game to the initial state and returns the boards array."""
+        # boards[game, player, row] has bit col set if player owns (row, col)
+        self.boards = np.zeros((self.batch_size, 2, BOARD_SIZE), dtype=np.uint16)
+        self.current_player = np.full(self.batch_size, PLAYER_X, dtype=np.int8)
+        self.winner = np.full(self.batch_size, NO_WINNER, dtype=np.int8)
+        self.game_over = np.zeros(self.batch_size, dtype=bool)
+        return self.boards
+
+    def get_valid_moves_mask(self) -> np.ndarray:
+        """Returns a (batch, BOARD_SIZE, BOARD_SIZE) bool array of playable cells."""
+        occupied = self.boards[:, PLAYER_X] | self.boards[:, PLAYER_O]
+        cols = np.arange(BOARD_SIZE, dtype=np.uint16)
+        empty = (np.right_shift(occupied[..., None], cols) & 1) == 0
+        empty[self.game_over] = False
+        return empty
+
+    def apply_moves(self, moves: np.ndarray) -> np.ndarray:
+        """
+        Plays one move for the current player of every game at once.
+        Games that are already over, or whose move is off the board or on an
+        occupied cell, are left untouched.
+        Args:
+            moves (np.ndarray): int array of shape (batch, 2) holding (row, col) per game.
+        Returns:
+            np.ndarray: bool array of shape (batch,), True where the move was applied.
+        """
+        rows = moves[:, 0]
+        cols = moves[:, 1]
+        applied = (
+            ~self.game_over
+            & (rows >= 0) & (rows < BOARD_SIZE)
+            & (cols >= 0) & (cols < BOARD_SIZE)
+        )
+        games = np.flatnonzero(applied)
+        rows = rows[games]
+        bits = np.left_shift(np.uint16(1), cols[games].astype(np.uint16))
+        occupied = self.boards[games, PLAYER_X, rows] | self.boards[games, PLAYER_O, rows]
+        is_empty = (occupied & bits) == 0
+        applied[games[~is_empty]] = False
+        games, rows, bits = games[is_empty], rows[is_empty], bits[is_empty]
+
+        players = self.current_player[games]
+        self.boards[games, players, rows] |= bits
+
+        won = check_wins(self.boards[games, players])
+        full = np.all(
+            (self.boards[games, PLAYER_X] | self.boards[games, PLAYER_O]) == _FULL_ROW,
+            axis=-1,
+        )
+        self.winner[games[won]] = players[won]
+        self.game_over[games[won | full]] = True
+        # Games that continue switch player
+        playing = games[~(won | full)]
+        self.current_player[playing] ^= 1
+        return applied
@@ -0,0 +1,37 @@
+# Optional JIT path for TicTacToeGame(use_jit=True); game_logic never imports
+# this module otherwise, so Numba is not needed to play or train.
+from numba import njit
+
+
+@njit(cache=True)
+def _run_length(board, player, row, col, dr, dc, limit):
+    """Counts consecutive `player` cells next to (row, col) stepping by (dr, dc), up to limit."""
+    n = board.shape[0]
+    count = 0
+    r = row + dr
+    c = col + dc
+    while count < limit and 0 <= r < n and 0 <= c < n and board[r, c] == player:
+        count += 1
+        r += dr
+        c += dc
+    return count
+
+
+@njit(cache=True)
+def check_win(board, player, row, col, win_length):
+    """
+    Checks whether `player` (game_logic.CELL_X or CELL_O) has a win_length line through
+    (row, col). Only the four lines through that cell are scanned, so this is
+    meant to be called right after the move at (row, col) is placed.
+    """
+    limit = win_length - 1
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        run = (
+            1
+            + _run_length(board, player, row, col, dr, dc, limit)
+            + _run_length(board, player, row, col, -dr, -dc, limit)
+        )
+        if run >= win_length:
+            return True
+    return False
+
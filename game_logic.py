@@ -1,79 +1,194 @@
-from typing import List, Literal, Optional, Tuple
+import operator
+import random
+from typing import TYPE_CHECKING, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field, validator
+if TYPE_CHECKING:
+    from game_logic_pydantic import GameState
 
 BOARD_SIZE = 12
 WIN_LENGTH = 5
 Player = Literal["X", "O"]
 CellValue = Literal["X", "O", " "]
+# Cell (r, c) is stored as bit r * BOARD_SIZE + c of a per-player bitboard.
+FULL_BOARD = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1
+# Cell codes of the byte board, also what the game_kernels JIT kernels expect
+CELL_EMPTY = 0
+CELL_X = 1
+CELL_O = 2
+_EMPTY_BOARD = bytes([CELL_EMPTY]) * (BOARD_SIZE * BOARD_SIZE)
+_CELL_SYMBOLS = {CELL_EMPTY: " ", CELL_X: "X", CELL_O: "O"}
+# Zobrist keys: ZOBRIST[idx * 2] for X on cell idx, ZOBRIST[idx * 2 + 1] for O.
+# Fixed seed so hashes are stable across runs (e.g., for saved Q-tables).
+_zobrist_rng = random.Random(0)
+ZOBRIST = tuple(_zobrist_rng.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE * 2))
+del _zobrist_rng
 
+Line = Tuple[int, Tuple[int, int], Tuple[int, int]]  # (bitmask, start, end)
 
-class GameState(BaseModel):
-    """Pydantic model to hold the state of the Tic Tac Toe game."""
 
-    board: List[List[CellValue]] = Field(
-        default_factory=lambda: [
-            [" " for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)
-        ],
-    )
-    current_player: Player = "X"
-    winner: Optional[Player] = None
-    game_over: bool = False
+def _build_lines() -> List[Line]:
+    """Enumerates every WIN_LENGTH line on the board as (bitmask, start, end)."""
+    lines = []
+    span = WIN_LENGTH - 1
+    # Horizontal, vertical, positive diagonal, negative diagonal
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                end_r, end_c = r + dr * span, c + dc * span
+                if not (0 <= end_r < BOARD_SIZE and 0 <= end_c < BOARD_SIZE):
+                    continue
+                mask = 0
+                for i in range(WIN_LENGTH):
+                    mask |= 1 << ((r + dr * i) * BOARD_SIZE + c + dc * i)
+                lines.append((mask, (r, c), (end_r, end_c)))
+    return lines
+
+
+_LINES = _build_lines()
+# _LINES_THROUGH[idx] holds only the lines that contain cell idx
+_LINES_THROUGH = tuple(
+    tuple(line for line in _LINES if (line[0] >> idx) & 1)
+    for idx in range(BOARD_SIZE * BOARD_SIZE)
+)
+
 
-    @validator("board")
-    def check_board_dimensions(cls, board):
-        if len(board) != BOARD_SIZE:
-            raise ValueError(f"Board must have {BOARD_SIZE} rows")
-        if not all(len(row) == BOARD_SIZE for row in board):
-            raise ValueError(f"Each row must have {BOARD_SIZE} columns")
-        return board
+def __getattr__(name: str):
+    """Keeps `from game_logic import GameState` working without importing pydantic up front."""
+    if name == "GameState":
+        from game_logic_pydantic import GameState
+
+        return GameState
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class TicTacToeGame:
-    def __init__(self):
+    # Fixed attribute set: cheaper construction and attribute access, which
+    # matters when training loops create and reset thousands of games
+    __slots__ = (
+        "board_size",
+        "win_length",
+        "current_player",
+        "winner",
+        "game_over",
+        "bb_x",
+        "bb_o",
+        "occ",
+        "zhash",
+        "board",
+        "board_np",
+        "last_move",
+        "_jit_check_win",
+    )
+
+    def __init__(self, use_jit: bool = False):
+        """
+        Args:
+            use_jit (bool): Check wins with the Numba kernel in game_kernels instead
+                            of the pure-Python bitboard check. Numba is only
+                            imported (and the kernel compiled) when this is set.
+        """
         self.board_size = BOARD_SIZE
         self.win_length = WIN_LENGTH
-        self.state = GameState()  # Initialize with default state
+        # One byte per cell (CELL_*) mirroring the bitboards
+        self.board = bytearray(self.board_size * self.board_size)
+        self._jit_check_win = None
+        self.board_np = None
+        if use_jit:
+            # Numba and numpy are optional, only needed here
+            import numpy as np
+
+            import game_kernels
+
+            self._jit_check_win = game_kernels.check_win
+            # Zero-copy (size, size) int8 view of the byte board for the kernel
+            self.board_np = np.frombuffer(self.board, dtype=np.int8).reshape(
+                self.board_size, self.board_size
+            )
+        self.reset()  # Initialize with default state
 
     def reset(self):
-        """Resets the game to the initial state by creating a new GameState."""
-        self.state = GameState()
+        """Resets the game to the initial state."""
+        # Plain attributes rather than a GameState model: make_move touches
+        # these on every ply, see snapshot() for the serializable form
+        self.current_player: Player = "X"
+        self.winner: Optional[Player] = None
+        self.game_over = False
+        self.bb_x = 0
+        self.bb_o = 0
+        self.occ = 0  # bb_x | bb_o
+        self.zhash = 0  # Zobrist hash of the position, updated in make_move
+        # Cleared in place so board_np (if any) stays a view of it
+        self.board[:] = _EMPTY_BOARD
+        self.last_move: Optional[Tuple[int, int]] = None
         return self.get_state_tuple()  # Return initial state tuple
 
-    def get_state_tuple(self) -> Tuple[str, ...]:
-        """Returns a hashable tuple representation of the current board state."""
-        return tuple("".join(row) for row in self.state.board)
+    def get_zobrist(self) -> int:
+        """Returns the 64-bit Zobrist hash of the current board state."""
+        return self.zhash
+
+    def get_state_tuple(self) -> int:
+        """Returns a hashable representation of the current board state."""
+        # Kept for existing callers; the state key is now the Zobrist hash
+        return self.get_zobrist()
 
     def get_board_list(self) -> List[List[CellValue]]:
         """Returns the board as a mutable list of lists (e.g., for Pygame drawing)."""
-        # Return a copy to prevent external modification of the Pydantic state directly
-        return [row[:] for row in self.state.board]
+        # Built from the byte board on demand, so callers always get a fresh copy
+        n = self.board_size
+        return [
+            [_CELL_SYMBOLS[cell] for cell in self.board[r * n : (r + 1) * n]]
+            for r in range(n)
+        ]
+
+    def snapshot(self) -> "GameState":
+        """Returns the current state as a GameState model (e.g., for serialization)."""
+        # The board is well-formed by construction, so skip re-running the
+        # validators; they still apply when GameState is built from outside data
+        from game_logic_pydantic import GameState  # Pydantic is only needed here
+
+        # model_construct on pydantic 2, where construct is deprecated and warns
+        construct = getattr(GameState, "model_construct", GameState.construct)
+        return construct(
+            board=self.get_board_list(),
+            current_player=self.current_player,
+            winner=self.winner,
+            game_over=self.game_over,
+        )
 
     def get_current_player(self) -> Player:
-        return self.state.current_player
+        return self.current_player
 
     def is_game_over(self) -> bool:
-        return self.state.game_over
+        return self.game_over
 
     def get_winner(self) -> Optional[Player]:
-        return self.state.winner
+        return self.winner
 
     def get_valid_moves(self) -> List[Tuple[int, int]]:
         """Returns a list of valid moves as (row, col) tuples."""
         moves = []
-        if not self.state.game_over:
-            for r in range(self.board_size):
-                for c in range(self.board_size):
-                    if self.state.board[r][c] == " ":
-                        moves.append((r, c))
+        if not self.game_over:
+            empty = ~self.occ & FULL_BOARD
+            while empty:
+                lowest = empty & -empty  # Visit only empty cells, lowest bit first
+                moves.append(divmod(lowest.bit_length() - 1, self.board_size))
+                empty ^= lowest
         return moves
 
+    def get_empty_bits(self) -> int:
+        """Returns a bitboard with bit row * board_size + col set for every valid move."""
+        if self.game_over:
+            return 0
+        return ~self.occ & FULL_BOARD
+
     def is_valid_move(self, row: int, col: int) -> bool:
         """Checks if a move is valid (within bounds and on an empty square)."""
+        # Plain ints only: numpy integers would overflow the 144-bit shifts below
+        row, col = operator.index(row), operator.index(col)
         return (
             0 <= row < self.board_size
             and 0 <= col < self.board_size
-            and self.state.board[row][col] == " "
+            and not (self.occ >> (row * self.board_size + col)) & 1
         )
 
     def make_move(self, row: int, col: int) -> bool:
@@ -82,89 +197,66 @@ class TicTacToeGame:
         Updates the game state (board, current_player, game_over, winner).
         Returns True if the move was successful, False otherwise.
         """
-        if self.state.game_over or not self.is_valid_move(row, col):
+        row, col = operator.index(row), operator.index(col)  # e.g. np.int64 from move masks
+        if self.game_over or not self.is_valid_move(row, col):
             return False  # Move is invalid or game already finished
 
-        # Directly modify the list within the Pydantic model
-        self.state.board[row][col] = self.state.current_player
+        idx = row * self.board_size + col
+        bit = 1 << idx
+        if self.current_player == "X":
+            self.bb_x |= bit
+            self.board[idx] = CELL_X
+            self.zhash ^= ZOBRIST[idx * 2]
+        else:
+            self.bb_o |= bit
+            self.board[idx] = CELL_O
+            self.zhash ^= ZOBRIST[idx * 2 + 1]
+        self.occ |= bit
+        self.last_move = (row, col)
 
-        # Check for win
-        if self._check_win(self.state.current_player):
-            self.state.winner = self.state.current_player
-            self.state.game_over = True
+        # Check for win (only lines through the new stone can have completed)
+        if self._check_win(self.current_player, row, col):
+            self.winner = self.current_player
+            self.game_over = True
             return True  # Move successful, game ended in a win
 
         # Check for draw
         if self._is_board_full():
-            self.state.winner = None  # Draw
-            self.state.game_over = True
+            self.winner = None  # Draw
+            self.game_over = True
             return True  # Move successful, game ended in a draw
 
         # Game continues, switch player
-        self.state.current_player = "O" if self.state.current_player == "X" else "X"
+        self.current_player = "O" if self.current_player == "X" else "X"
         return True  # Move successful, game continues
 
-    def _check_win(self, player: Player) -> bool:
-        """Internal method to check if the specified player has won."""
-        board = self.state.board
-        # Check horizontal
-        for r in range(self.board_size):
-            for c in range(self.board_size - self.win_length + 1):
-                if all(board[r][c + i] == player for i in range(self.win_length)):
-                    return True
-        # Check vertical
-        for r in range(self.board_size - self.win_length + 1):
-            for c in range(self.board_size):
-                if all(board[r + i][c] == player for i in range(self.win_length)):
-                    return True
-        # Check positive diagonal
-        for r in range(self.board_size - self.win_length + 1):
-            for c in range(self.board_size - self.win_length + 1):
-                if all(board[r + i][c + i] == player for i in range(self.win_length)):
-                    return True
-        # Check negative diagonal
-        for r in range(self.board_size - self.win_length + 1):
-            for c in range(self.win_length - 1, self.board_size):
-                if all(board[r + i][c - i] == player for i in range(self.win_length)):
-                    return True
+    def _check_win(self, player: Player, row: int, col: int) -> bool:
+        """Internal method to check if the player's move at (row, col) won the game."""
+        if self._jit_check_win is not None:
+            cell = CELL_X if player == "X" else CELL_O
+            return self._jit_check_win(self.board_np, cell, row, col, self.win_length)
+        bb = self.bb_x if player == "X" else self.bb_o
+        for mask, _, _ in _LINES_THROUGH[row * self.board_size + col]:
+            if bb & mask == mask:
+                return True
         return False
 
     def _is_board_full(self) -> bool:
         """Internal method to check if the board is full."""
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-                if self.state.board[r][c] == " ":
-                    return False
-        return True
+        return self.occ == FULL_BOARD
 
     # Helper specifically for the Pygame version to get line coords for drawing
     def get_winning_line_coords(
         self,
     ) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """Checks for a win and returns (start_pos, end_pos) if found, else None."""
-        if not self.state.winner:
+        if not self.winner:
             return None
 
-        player = self.state.winner
-        board = self.state.board
-        # Check horizontal
-        for r in range(self.board_size):
-            for c in range(self.board_size - self.win_length + 1):
-                if all(board[r][c + i] == player for i in range(self.win_length)):
-                    return (r, c), (r, c + self.win_length - 1)
-        # Check vertical
-        for r in range(self.board_size - self.win_length + 1):
-            for c in range(self.board_size):
-                if all(board[r + i][c] == player for i in range(self.win_length)):
-                    return (r, c), (r + self.win_length - 1, c)
-        # Check positive diagonal
-        for r in range(self.board_size - self.win_length + 1):
-            for c in range(self.board_size - self.win_length + 1):
-                if all(board[r + i][c + i] == player for i in range(self.win_length)):
-                    return (r, c), (r + self.win_length - 1, c + self.win_length - 1)
-        # Check negative diagonal
-        for r in range(self.board_size - self.win_length + 1):
-            for c in range(self.win_length - 1, self.board_size):
-                if all(board[r + i][c - i] == player for i in range(self.win_length)):
-                    return (r, c), (r + self.win_length - 1, c - self.win_length + 1)
+        # The winning line always runs through the move that ended the game
+        row, col = self.last_move
+        bb = self.bb_x if self.winner == "X" else self.bb_o
+        for mask, start, end in _LINES_THROUGH[row * self.board_size + col]:
+            if bb & mask == mask:
+                return start, end
         return None  # Should not happen if self.winner is set correctly
@@ -0,0 +1,26 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, validator
+
+from game_logic import BOARD_SIZE, CellValue, Player
+
+
+class GameState(BaseModel):
+    """Pydantic model to hold the state of the Tic Tac Toe game."""
+
+    board: List[List[CellValue]] = Field(
+        default_factory=lambda: [
+            [" " for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)
+        ],
+    )
+    current_player: Player = "X"
+    winner: Optional[Player] = None
+    game_over: bool = False
+
+    @validator("board")
+    def check_board_dimensions(cls, board):
+        if len(board) != BOARD_SIZE:
+            raise ValueError(f"Board must have {BOARD_SIZE} rows")
+        if not all(len(row) == BOARD_SIZE for row in board):
+            raise ValueError(f"Each row must have {BOARD_SIZE} columns")
+        return board
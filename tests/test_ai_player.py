@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from ai_player import RandomAIPlayer, TranspositionTable
+from game_logic import BOARD_SIZE, FULL_BOARD, TicTacToeGame
+
+
+def test_put_and_get_keep_deeper_result_for_a_position():
+    tt = TranspositionTable(capacity=8)
+    tt.put(42, 3, 1.0, (0, 0))
+    tt.put(42, 1, -1.0, (1, 1))  # Shallower, ignored
+    assert tt.get(42) == (3, 1.0, (0, 0))
+    tt.put(42, 5, 0.5, (2, 2))
+    assert tt.get(42) == (5, 0.5, (2, 2))
+    assert len(tt) == 1
+    assert tt.get(7) is None
+
+
+def test_full_table_evicts_one_entry_at_equal_depth():
+    tt = TranspositionTable(capacity=5)
+    for key in range(5):
+        tt.put(key, 3, 0.0, None)
+    size = len(tt)
+    tt.put(5, 3, 0.0, None)
+    assert tt.get(5) is not None
+    assert len(tt) == size  # One victim replaced, nothing else dropped
+    assert size == tt.capacity
+
+
+def test_deeper_entry_is_demoted_not_dropped():
+    tt = TranspositionTable(capacity=2)  # A single bucket
+    tt.put(1, 4, 0.0, None)
+    tt.put(2, 6, 0.0, None)
+    assert tt.get(1).depth == 4 and tt.get(2).depth == 6
+    tt.put(3, 2, 0.0, None)  # Shallower: takes the always-replace slot
+    assert tt.get(2) is not None and tt.get(3) is not None and tt.get(1) is None
+
+
+def test_put_at_capacity_only_touches_its_bucket():
+    tt = TranspositionTable(capacity=64)
+    rng = random.Random(0)
+    while len(tt) < tt.capacity:
+        tt.put(rng.getrandbits(64), rng.randrange(5), 0.0, None)
+    for _ in range(500):
+        key, depth = rng.getrandbits(64), rng.randrange(5)
+        before = list(zip(tt._keys, tt._entries))
+        tt.put(key, depth, 1.0, (0, 0))
+        after = list(zip(tt._keys, tt._entries))
+        changed = {slot for slot, (old, new) in enumerate(zip(before, after)) if old != new}
+        bucket = (key % (tt.capacity // 2)) * 2
+        assert changed <= {bucket, bucket + 1}
+        assert len(tt) == tt.capacity
+
+
+def test_clear_keeps_slot_lists():
+    tt = TranspositionTable(capacity=8)
+    keys = tt._keys
+    tt.put(1, 1, 0.0, None)
+    tt.clear()
+    assert tt._keys is keys and len(tt) == 0 and tt.get(1) is None
+    assert len(tt._keys) == tt.capacity
+
+
+def test_random_ai_replays_stored_move():
+    tt = TranspositionTable(capacity=64)
+    game = TicTacToeGame()
+    first = RandomAIPlayer("X", transposition_table=tt).get_move(game)
+    assert RandomAIPlayer("X", transposition_table=tt).get_move(game) == first
+    tt.clear()
+    assert len(tt) == 0 and tt.get(game.get_zobrist()) is None
+
+
+@pytest.mark.parametrize("n_occupied", [40, 110])  # Rejection sampling, then the bit walk
+def test_random_ai_samples_every_empty_cell(n_occupied):
+    random.seed(0)
+    game = TicTacToeGame()
+    cells = random.sample(range(BOARD_SIZE * BOARD_SIZE), n_occupied)
+    for idx in cells:
+        game.occ |= 1 << idx  # Occupancy only: no wins to end the game early
+    empty = {divmod(idx, BOARD_SIZE) for idx in range(BOARD_SIZE * BOARD_SIZE)} - {
+        divmod(idx, BOARD_SIZE) for idx in cells
+    }
+    ai = RandomAIPlayer("X")
+    seen = set()
+    for _ in range(3000):
+        move = ai.get_move(game)
+        assert game.is_valid_move(*move)
+        seen.add(move)
+    assert seen == empty
+
+
+def test_random_ai_full_board_returns_none():
+    game = TicTacToeGame()
+    game.occ = FULL_BOARD
+    assert RandomAIPlayer("O").get_move(game) is None
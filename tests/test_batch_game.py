@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from batch_game import NO_WINNER, PLAYER_O, PLAYER_X, BatchTicTacToe, _run_steps, check_wins
+from game_logic import BOARD_SIZE, WIN_LENGTH, TicTacToeGame
+
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def bitboard(cells):
+    """Builds a (BOARD_SIZE,) uint16 row bitboard with the given (row, col) cells set."""
+    bb = np.zeros(BOARD_SIZE, dtype=np.uint16)
+    for r, c in cells:
+        bb[r] |= np.uint16(1 << c)
+    return bb
+
+
+def runs(length):
+    """Every on-board run of `length` cells, in every direction."""
+    for dr, dc in DIRECTIONS:
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                cells = [(r + dr * i, c + dc * i) for i in range(length)]
+                if all(0 <= rr < BOARD_SIZE and 0 <= cc < BOARD_SIZE for rr, cc in cells):
+                    yield cells
+
+
+def test_run_steps_reach_the_length():
+    assert _run_steps(5) == (1, 2, 1)
+    for length in range(1, 20):
+        steps = _run_steps(length)
+        run = 1
+        for step in steps:
+            assert step <= run  # Each step joins two runs that already exist
+            run += step
+        assert run == max(length, 1)
+
+
+def test_check_wins_every_line():
+    wins = np.stack([bitboard(cells) for cells in runs(WIN_LENGTH)])
+    assert check_wins(wins).all()
+    short = np.stack([bitboard(cells) for cells in runs(WIN_LENGTH - 1)])
+    assert not check_wins(short).any()
+    assert not check_wins(np.zeros((3, BOARD_SIZE), dtype=np.uint16)).any()
+
+
+@pytest.mark.parametrize(
+    "cells",
+    [
+        # Row wrap: the last cells of one row then the first cells of the next
+        [(3, 10), (3, 11), (4, 0), (4, 1), (4, 2)],
+        # Diagonal running off the right edge and continuing on the left
+        [(0, 9), (1, 10), (2, 11), (3, 0), (4, 1)],
+        # Anti-diagonal running off the left edge; the left shift pushes these
+        # past column BOARD_SIZE - 1
+        [(0, 2), (1, 1), (2, 0), (3, 11), (4, 10)],
+        # Anti-diagonal leaving column 0 and coming back in at column 11 one
+        # flat index (BOARD_SIZE - 1) later, i.e. on the same row
+        [(0, 3), (1, 2), (2, 1), (3, 0), (3, 11)],
+    ],
+)
+def test_check_wins_does_not_wrap(cells):
+    assert not check_wins(bitboard(cells)[None])[0]
+
+
+def test_check_wins_batch_shape():
+    bbs = np.zeros((2, 3, BOARD_SIZE), dtype=np.uint16)
+    bbs[1, 2] = bitboard([(7, c) for c in range(2, 2 + WIN_LENGTH)])
+    expected = np.zeros((2, 3), dtype=bool)
+    expected[1, 2] = True
+    np.testing.assert_array_equal(check_wins(bbs), expected)
+
+
+def test_lockstep_with_tic_tac_toe_game():
+    rng = np.random.default_rng(0)
+    batch_size = 64
+    batch = BatchTicTacToe(batch_size)
+    games = [TicTacToeGame() for _ in range(batch_size)]
+    for _ in range(3):  # Replay after reset as well
+        batch.reset()
+        for game in games:
+            game.reset()
+        for _ply in range(BOARD_SIZE * BOARD_SIZE * 2):
+            if batch.game_over.all():
+                break
+            # Mostly random playable cells, plus off-board and occupied ones
+            mask = batch.get_valid_moves_mask()
+            moves = rng.integers(-2, BOARD_SIZE + 2, size=(batch_size, 2))
+            for i in np.flatnonzero(rng.random(batch_size) < 0.8):
+                playable = np.argwhere(mask[i])
+                if len(playable):
+                    moves[i] = playable[rng.integers(len(playable))]
+            applied = batch.apply_moves(moves)
+            for i, game in enumerate(games):
+                r, c = (int(v) for v in moves[i])
+                assert bool(applied[i]) == game.make_move(r, c)
+                if 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE:
+                    assert bool(mask[i, r, c]) == bool(applied[i])
+                assert bool(batch.game_over[i]) == game.is_game_over()
+                winner = {None: NO_WINNER, "X": PLAYER_X, "O": PLAYER_O}[game.get_winner()]
+                assert batch.winner[i] == winner
+                player = PLAYER_X if game.get_current_player() == "X" else PLAYER_O
+                assert batch.current_player[i] == player
+        assert batch.game_over.all()
+        # Compare final boards cell by cell
+        for i, game in enumerate(games):
+            board = game.get_board_list()
+            for r in range(BOARD_SIZE):
+                for c in range(BOARD_SIZE):
+                    x = bool((int(batch.boards[i, PLAYER_X, r]) >> c) & 1)
+                    o = bool((int(batch.boards[i, PLAYER_O, r]) >> c) & 1)
+                    assert (x, o) == (board[r][c] == "X", board[r][c] == "O")
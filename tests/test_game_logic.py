@@ -0,0 +1,131 @@
+import itertools
+import os
+import random
+import subprocess
+import sys
+import warnings
+
+import numpy as np
+import pytest
+
+import game_logic
+from game_logic import BOARD_SIZE, TicTacToeGame
+
+
+def test_numpy_coordinates_place_a_stone():
+    # Cell (8, 5) is bit 101, past what an int64 shift can hold
+    game = TicTacToeGame()
+    assert game.is_valid_move(np.int64(8), np.int64(5))
+    assert game.make_move(np.int64(8), np.int64(5))
+    assert type(game.occ) is int
+    assert not game.is_valid_move(np.int64(8), np.int64(5))
+    assert game.get_board_list()[8][5] == "X"
+    assert len(game.get_valid_moves()) == BOARD_SIZE * BOARD_SIZE - 1
+
+
+def test_numpy_coordinates_win_and_line():
+    game = TicTacToeGame()
+    for c in range(4):
+        game.make_move(np.int64(11), np.int64(c))  # X along the bottom row
+        game.make_move(np.int64(0), np.int64(c))  # O along the top row
+    assert game.make_move(np.int64(11), np.int64(4))
+    assert game.is_game_over()
+    assert game.get_winner() == "X"
+    assert game.get_winning_line_coords() == ((11, 0), (11, 4))
+
+
+def test_import_does_not_load_numba_or_numpy():
+    # game_logic must stay importable without Numba; the JIT path is opt-in
+    code = (
+        "import sys, game_logic; game_logic.TicTacToeGame().make_move(0, 0); "
+        "print('numba' in sys.modules or 'numpy' in sys.modules)"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_import_does_not_load_pydantic():
+    code = "import sys, game_logic; game_logic.TicTacToeGame().make_move(0, 0); print('pydantic' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_game_state_still_importable_from_game_logic():
+    from game_logic import GameState
+    from game_logic_pydantic import GameState as PydanticGameState
+
+    assert GameState is PydanticGameState
+    with pytest.raises(AttributeError):
+        game_logic.NoSuchName
+
+
+def test_jit_and_python_win_checks_agree():
+    pytest.importorskip("numba")
+    rng = random.Random(0)
+    for _ in range(50):
+        games = [TicTacToeGame(), TicTacToeGame(use_jit=True)]
+        moves = [(r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE)]
+        rng.shuffle(moves)
+        for move in moves:
+            assert games[0].make_move(*move) == games[1].make_move(*move)
+            assert games[0].is_game_over() == games[1].is_game_over()
+            if games[0].is_game_over():
+                break
+        assert games[0].get_winner() == games[1].get_winner()
+
+
+def test_snapshot_does_not_warn():
+    game = TicTacToeGame()
+    game.make_move(2, 3)
+    game.snapshot()  # First call imports game_logic_pydantic, whose @validator warns on pydantic 2
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        state = game.snapshot()
+    assert state.board[2][3] == "X"
+    assert state.current_player == "O"
+    assert state.winner is None and not state.game_over
+
+
+def play(moves):
+    game = TicTacToeGame()
+    for move in moves:
+        assert game.make_move(*move)
+    return game
+
+
+def test_zobrist_is_independent_of_move_order():
+    a = play([(0, 0), (5, 5), (1, 1), (6, 6)])
+    b = play([(1, 1), (6, 6), (0, 0), (5, 5)])
+    assert a.get_zobrist() == b.get_zobrist()
+    assert a.get_state_tuple() == a.get_zobrist()
+
+
+def test_zobrist_distinguishes_players_on_a_cell():
+    x_there = play([(3, 3), (7, 7)])
+    o_there = play([(7, 7), (3, 3)])
+    assert x_there.get_zobrist() != o_there.get_zobrist()
+
+
+def test_zobrist_resets_to_empty_board_value():
+    game = TicTacToeGame()
+    empty = game.get_zobrist()
+    for move in [(0, 0), (1, 1), (2, 2)]:
+        game.make_move(*move)
+    assert game.get_zobrist() != empty
+    assert game.reset() == empty
+    assert game.get_zobrist() == empty
+
+
+def test_zobrist_no_collisions_over_x_o_assignments():
+    # Every split of the same 10 cells into 5 X and 5 O stones is a distinct position
+    cells = [(r, c) for r in range(0, 10, 3) for c in range(0, 12, 4)][:10]
+    hashes = set()
+    count = 0
+    for xs in itertools.combinations(cells, 5):
+        os_ = [cell for cell in cells if cell not in xs]
+        moves = [move for pair in zip(xs, os_) for move in pair]
+        hashes.add(play(moves).get_zobrist())
+        count += 1
+    assert len(hashes) == count == 252
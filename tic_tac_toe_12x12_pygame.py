@@ -46,47 +46,93 @@ legend_font = pygame.font.Font(None, 25)  # Smaller font for legends
 turn_font = pygame.font.Font(None, 35)  # Font for turn indicator
 button_font = pygame.font.Font(None, 50) # Font for mode selection buttons
 
+# --- Pre-rendered Sprites ---
+
+def render_sprites():
+    """Rasterizes the X, O and hover surfaces once, in cell-local coordinates."""
+    center = SQUARE_SIZE // 2
+    o_surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+    pygame.draw.circle(o_surf, CIRCLE_COLOR, (center, center), CIRCLE_RADIUS, CROSS_WIDTH // 2) # Thinner circle line
+    x_surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+    # Draw anti-aliased lines for X
+    near, far = SPACE, SQUARE_SIZE - SPACE
+    pygame.draw.aaline(x_surf, CROSS_COLOR, (near, near), (far, far), CROSS_WIDTH // 2)
+    pygame.draw.aaline(x_surf, CROSS_COLOR, (far, near), (near, far), CROSS_WIDTH // 2)
+    hover_surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+    hover_surf.fill(HOVER_COLOR)
+    return x_surf.convert_alpha(), o_surf.convert_alpha(), hover_surf.convert_alpha()
+
+X_SURF, O_SURF, HOVER_SURF = render_sprites()
+
+# Text never changes once rendered, so every label is rendered once up front
+LEGEND_SURFS = [legend_font.render(str(i), True, LEGEND_COLOR) for i in range(BOARD_SIZE)]
+TURN_SURFS = {player: turn_font.render(f"Player {player}'s Turn", True, TURN_COLOR) for player in ('X', 'O')}
+MESSAGE_SURFS = {
+    message: font.render(message, True, MESSAGE_COLOR)
+    for message in ("Player X wins!", "Player O wins!", "It's a Draw!")
+}
+RESTART_SURF = legend_font.render("Press 'R' to Restart", True, WHITE)
+
+# Events after which the window contents may have been lost (uncovered, restored
+# from minimized), so the dirty-rect renderer has to repaint everything
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
 # --- Drawing Functions ---
 
-def draw_lines():
+def draw_lines(surface):
     # Draw grid lines offset by margins
     # Horizontal
     for i in range(BOARD_SIZE + 1):
         y = MARGIN_TOP + i * SQUARE_SIZE
-        pygame.draw.line(screen, LINE_COLOR, (MARGIN_LEFT, y), (MARGIN_LEFT + GRID_WIDTH, y), 2 if i == 0 or i == BOARD_SIZE else 1)
+        pygame.draw.line(surface, LINE_COLOR, (MARGIN_LEFT, y), (MARGIN_LEFT + GRID_WIDTH, y), 2 if i == 0 or i == BOARD_SIZE else 1)
     # Vertical
     for i in range(BOARD_SIZE + 1):
         x = MARGIN_LEFT + i * SQUARE_SIZE
-        pygame.draw.line(screen, LINE_COLOR, (x, MARGIN_TOP), (x, MARGIN_TOP + GRID_HEIGHT), 2 if i == 0 or i == BOARD_SIZE else 1)
+        pygame.draw.line(surface, LINE_COLOR, (x, MARGIN_TOP), (x, MARGIN_TOP + GRID_HEIGHT), 2 if i == 0 or i == BOARD_SIZE else 1)
 
-def draw_legends():
+def draw_legends(surface):
     # Draw column numbers (0-11) above the grid
     for i in range(BOARD_SIZE):
-        text = legend_font.render(str(i), True, LEGEND_COLOR)
+        text = LEGEND_SURFS[i]
         text_rect = text.get_rect(center=(MARGIN_LEFT + i * SQUARE_SIZE + SQUARE_SIZE // 2, MARGIN_TOP - 20))
-        screen.blit(text, text_rect)
+        surface.blit(text, text_rect)
     # Draw row numbers (0-11) left of the grid
     for i in range(BOARD_SIZE):
-        text = legend_font.render(str(i), True, LEGEND_COLOR)
+        text = LEGEND_SURFS[i]
         text_rect = text.get_rect(center=(MARGIN_LEFT - 25, MARGIN_TOP + i * SQUARE_SIZE + SQUARE_SIZE // 2))
-        screen.blit(text, text_rect)
+        surface.blit(text, text_rect)
+
+def build_background():
+    """Renders the static parts of the screen (background, grid, legends) once."""
+    background = pygame.Surface((WIDTH, HEIGHT))
+    background.fill(BG_COLOR)
+    draw_lines(background)
+    draw_legends(background)
+    return background
+
+def cell_rect(row, col):
+    """Returns the screen rect covered by the board cell at (row, col)."""
+    return pygame.Rect(MARGIN_LEFT + col * SQUARE_SIZE, MARGIN_TOP + row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+
+def draw_figure(row, col, symbol):
+    # Blit the pre-rendered X or O sprite into the cell
+    if symbol == 'O':
+        screen.blit(O_SURF, cell_rect(row, col))
+    elif symbol == 'X':
+        screen.blit(X_SURF, cell_rect(row, col))
 
 def draw_figures(board): # Takes the board state as argument
-    # Draw X's and O's offset by margins
+    # Draw all X's and O's (used for full redraws only)
     for row in range(BOARD_SIZE):
         for col in range(BOARD_SIZE):
-            center_x = MARGIN_LEFT + col * SQUARE_SIZE + SQUARE_SIZE // 2
-            center_y = MARGIN_TOP + row * SQUARE_SIZE + SQUARE_SIZE // 2
-            if board[row][col] == 'O':
-                pygame.draw.circle(screen, CIRCLE_COLOR, (center_x, center_y), CIRCLE_RADIUS, CROSS_WIDTH // 2) # Thinner circle line
-            elif board[row][col] == 'X':
-                # Draw anti-aliased lines for X
-                top_left = (center_x - (SQUARE_SIZE // 2 - SPACE), center_y - (SQUARE_SIZE // 2 - SPACE))
-                top_right = (center_x + (SQUARE_SIZE // 2 - SPACE), center_y - (SQUARE_SIZE // 2 - SPACE))
-                bottom_left = (center_x - (SQUARE_SIZE // 2 - SPACE), center_y + (SQUARE_SIZE // 2 - SPACE))
-                bottom_right = (center_x + (SQUARE_SIZE // 2 - SPACE), center_y + (SQUARE_SIZE // 2 - SPACE))
-                pygame.draw.aaline(screen, CROSS_COLOR, top_left, bottom_right, CROSS_WIDTH // 2)
-                pygame.draw.aaline(screen, CROSS_COLOR, top_right, bottom_left, CROSS_WIDTH // 2)
+            draw_figure(row, col, board[row][col])
+
+def redraw_cell(background, row, col, symbol):
+    """Restores one cell from the cached background, redraws its figure and returns the dirty rect."""
+    rect = cell_rect(row, col)
+    screen.blit(background, rect, rect)
+    draw_figure(row, col, symbol)
+    return rect
 
 def display_message(message):
     # Display message in the bottom margin
@@ -97,29 +143,30 @@ def display_message(message):
         (0, MARGIN_TOP + GRID_HEIGHT, WIDTH, MARGIN_BOTTOM),
     )  # Clear bottom margin
     # Display the main message (Win/Draw)
-    text = font.render(message, True, MESSAGE_COLOR)
+    text = MESSAGE_SURFS.get(message) or font.render(message, True, MESSAGE_COLOR)
     text_rect = text.get_rect(
         center=(WIDTH // 2, MARGIN_TOP + GRID_HEIGHT + MARGIN_BOTTOM // 2 - 10),
     )  # Shift up slightly
     screen.blit(text, text_rect)
     # Always display restart instruction
-    restart_text = legend_font.render("Press 'R' to Restart", True, WHITE)
+    restart_text = RESTART_SURF
     restart_rect = restart_text.get_rect(
         center=(WIDTH // 2, MARGIN_TOP + GRID_HEIGHT + MARGIN_BOTTOM // 2 + 15),
     )  # Shift down slightly
     screen.blit(restart_text, restart_rect)
+    return pygame.Rect(0, MARGIN_TOP + GRID_HEIGHT, WIDTH, MARGIN_BOTTOM)
 
 def display_turn(player):
     # Display current player's turn in the top margin
     # Clear the area first
     pygame.draw.rect(screen, BG_COLOR, (0, 0, WIDTH, MARGIN_TOP))
-    message = f"Player {player}'s Turn"
-    text = turn_font.render(message, True, TURN_COLOR)
+    text = TURN_SURFS[player]
     text_rect = text.get_rect(center=(WIDTH // 2, MARGIN_TOP // 2))
     screen.blit(text, text_rect)
+    return pygame.Rect(0, 0, WIDTH, MARGIN_TOP)
 
 def draw_winning_line(start_pos, end_pos, progress):
-    """Draws the winning line with animation progress (0.0 to 1.0)."""
+    """Draws the winning line with animation progress (0.0 to 1.0) and returns its dirty rect."""
     start_x = MARGIN_LEFT + start_pos[1] * SQUARE_SIZE + SQUARE_SIZE // 2
     start_y = MARGIN_TOP + start_pos[0] * SQUARE_SIZE + SQUARE_SIZE // 2
     end_x = MARGIN_LEFT + end_pos[1] * SQUARE_SIZE + SQUARE_SIZE // 2
@@ -130,13 +177,31 @@ def draw_winning_line(start_pos, end_pos, progress):
     current_end_y = start_y + (end_y - start_y) * progress
 
     if progress > 0:  # Only draw if progress has started
-        pygame.draw.line(
+        return pygame.draw.line(
             screen,
             WIN_LINE_COLOR,
             (start_x, start_y),
             (current_end_x, current_end_y),
             7,
         )
+    return None
+
+def get_hover_cell(game, mouse_pos):
+    """Returns the (row, col) under mouse_pos if it is a playable cell, else (-1, -1)."""
+    if (
+        MARGIN_LEFT < mouse_pos[0] < MARGIN_LEFT + GRID_WIDTH
+        and MARGIN_TOP < mouse_pos[1] < MARGIN_TOP + GRID_HEIGHT
+    ):
+        col = int((mouse_pos[0] - MARGIN_LEFT) // SQUARE_SIZE)
+        row = int((mouse_pos[1] - MARGIN_TOP) // SQUARE_SIZE)
+        # Check if the cell is empty and game not over using game object
+        if game.is_valid_move(row, col) and not game.is_game_over():
+            return row, col
+    return -1, -1
+
+def is_human_to_move(game_mode, game):
+    """Human moves always in pvp, only if the current player is X in pve."""
+    return game_mode == 'pvp' or (game_mode == 'pve' and game.get_current_player() == 'X')
 
 def draw_button(text, rect, color, hover_color):
     """Draws a button and handles hover effect."""
@@ -192,7 +257,20 @@ def main():
     win_line_end_pos = None
     animating_win_line = False
     animation_progress = 0.0
-    hover_row, hover_col = -1, -1 # Track hovered cell
+    # Hover cell and turn owner only change on mouse motion, moves and resets,
+    # so they are cached here and recomputed from those events
+    mouse_pos = pygame.mouse.get_pos()
+    hover_row, hover_col = get_hover_cell(game, mouse_pos) # Track hovered cell
+    is_human_turn = is_human_to_move(game_mode, game)
+
+    # Rendering state: the screen keeps its contents between frames, so only
+    # regions that changed are redrawn and passed to pygame.display.update
+    background = build_background()
+    board = game.get_board_list() # Local copy of the board, updated as moves are made
+    moved_cells = [] # Cells changed since the last frame
+    drawn_hover = None # Cell currently showing the hover highlight
+    drawn_status = None # (game_over, winner, current_player) currently displayed
+    needs_full_redraw = True
 
     clock = pygame.time.Clock()  # For controlling animation frame rate
 
@@ -205,27 +283,25 @@ def main():
 
     while True:
         # --- Event Handling ---
-        mouse_pos = pygame.mouse.get_pos()  # Get mouse position every frame for hover
-        hover_row, hover_col = -1, -1  # Reset hover each frame
-
-        # Calculate potential hover cell based on mouse position
-        if (
-            MARGIN_LEFT < mouse_pos[0] < MARGIN_LEFT + GRID_WIDTH
-            and MARGIN_TOP < mouse_pos[1] < MARGIN_TOP + GRID_HEIGHT
-        ):
-            temp_col = int((mouse_pos[0] - MARGIN_LEFT) // SQUARE_SIZE)
-            temp_row = int((mouse_pos[1] - MARGIN_TOP) // SQUARE_SIZE)
-            # Check if the cell is empty and game not over using game object
-            if game.is_valid_move(temp_row, temp_col) and not game.is_game_over():
-                 hover_row, hover_col = temp_row, temp_col
-
-        # Determine if it's the human's turn (always in pvp, only if current player is X in pve)
-        is_human_turn = (game_mode == 'pvp' or (game_mode == 'pve' and game.get_current_player() == 'X'))
+        # Sleep until the next event when nothing is animating and no AI move is due,
+        # instead of re-running the loop 60 times a second on an unchanged screen
+        ai_to_move = game_mode == 'pve' and game.get_current_player() == 'O' and not game.is_game_over()
+        if animating_win_line or ai_to_move or needs_full_redraw:
+            events = pygame.event.get()
+        else:
+            events = [pygame.event.wait()] + pygame.event.get()
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 sys.exit()
 
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+                hover_row, hover_col = get_hover_cell(game, mouse_pos)
+
+            if event.type in REDRAW_EVENTS:
+                needs_full_redraw = True
+
             # Handle human click only if it's their turn
             if event.type == pygame.MOUSEBUTTONDOWN and not game.is_game_over() and is_human_turn:
                 mouseX = event.pos[0]
@@ -242,8 +318,12 @@ def main():
                     clicked_row, clicked_col = -1, -1  # Click outside grid
 
                 if 0 <= clicked_row < BOARD_SIZE and 0 <= clicked_col < BOARD_SIZE: # Check if click is within grid bounds
+                    player = game.get_current_player()
                     move_successful = game.make_move(clicked_row, clicked_col)
                     if move_successful:
+                        board[clicked_row][clicked_col] = player
+                        moved_cells.append((clicked_row, clicked_col))
+                        is_human_turn = is_human_to_move(game_mode, game)
                         if game.is_game_over():
                             winner = game.get_winner() # Get winner from game state
                             if winner: # If there's a winner, get coords and start animation
@@ -266,6 +346,9 @@ def main():
                     win_line_end_pos = None
                     animating_win_line = False
                     animation_progress = 0.0
+                    board = game.get_board_list()
+                    moved_cells = []
+                    needs_full_redraw = True
                     # If AI mode, potentially reset AI state if needed (depends on AI implementation)
                     if game_mode == 'pve':
                          print("Game reset. AI state might need reset depending on implementation.")
@@ -277,6 +360,9 @@ def main():
             ai_move = ai_player.get_move(game)
             if ai_move:
                 move_successful = game.make_move(ai_move[0], ai_move[1])
+                if move_successful:
+                    board[ai_move[0]][ai_move[1]] = 'O'
+                    moved_cells.append(ai_move)
                 if move_successful and game.is_game_over():
                     winner = game.get_winner()
                     if winner: # AI won
@@ -290,53 +376,75 @@ def main():
                 print("AI Error: Could not find a valid move.") # Should not happen in normal play
 
 
-        # --- Drawing Phase ---
-        screen.fill(BG_COLOR)  # Clear screen first
-        draw_lines()
-        draw_legends()
-        draw_figures(game.get_board_list()) # Draw current X's and O's from game state
-
-        # Draw Hover Highlight
+        # A move or reset changes which cells are playable and whose turn it is
+        if moved_cells or needs_full_redraw:
+            hover_row, hover_col = get_hover_cell(game, mouse_pos)
+            is_human_turn = is_human_to_move(game_mode, game)
+
+        # --- Drawing Phase (only changed regions are redrawn) ---
+        dirty = []
+        if needs_full_redraw:
+            screen.blit(background, (0, 0))
+            draw_figures(board)
+            if game.is_game_over() and win_line_start_pos and win_line_end_pos and not animating_win_line:
+                draw_winning_line(win_line_start_pos, win_line_end_pos, 1.0)
+            dirty.append(screen.get_rect())
+            drawn_hover = None
+            drawn_status = None
+            needs_full_redraw = False
+
+        # Hover Highlight: restore the previously highlighted cell, highlight the new one
+        hover = None
         if hover_row != -1 and hover_col != -1 and is_human_turn: # Only show hover on human turn
-            # Create a surface for transparency
-            hover_surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-            hover_surface.fill(HOVER_COLOR)
-            screen.blit(
-                hover_surface,
-                (
-                    MARGIN_LEFT + hover_col * SQUARE_SIZE,
-                    MARGIN_TOP + hover_row * SQUARE_SIZE,
-                ),
-            )
-
-        # Draw Winning Line Animation or Static Line
+            hover = (hover_row, hover_col)
+        if hover != drawn_hover and drawn_hover:
+            dirty.append(redraw_cell(background, drawn_hover[0], drawn_hover[1], board[drawn_hover[0]][drawn_hover[1]]))
+
+        # Newly placed X's and O's
+        for row, col in moved_cells:
+            dirty.append(redraw_cell(background, row, col, board[row][col]))
+            if (row, col) == drawn_hover:
+                drawn_hover = None # Redrawn without the highlight, re-apply it below
+        moved_cells = []
+
+        if hover != drawn_hover and hover:
+            screen.blit(HOVER_SURF, cell_rect(hover_row, hover_col))
+            dirty.append(cell_rect(hover_row, hover_col))
+        drawn_hover = hover
+
+        # Draw Winning Line Animation (the finished line stays on screen until a full redraw)
         if animating_win_line:
             animation_progress += ANIMATION_SPEED
             if win_line_start_pos and win_line_end_pos: # Ensure coords exist
-                draw_winning_line(
+                line_rect = draw_winning_line(
                     win_line_start_pos,
                     win_line_end_pos,
                     min(1.0, animation_progress),
                 )
+                if line_rect:
+                    dirty.append(line_rect)
             if animation_progress >= 1.0:
                 animating_win_line = False  # Animation finished
-        elif game.is_game_over() and game.get_winner(): # Draw full line after animation or if loaded into win state
-             if win_line_start_pos and win_line_end_pos: # Ensure coords exist
-                 draw_winning_line(win_line_start_pos, win_line_end_pos, 1.0)
 
-        # Display Status (Turn or Game Over Message)
-        if not game.is_game_over():
-            display_turn(game.get_current_player())
-        else:
-            winner = game.get_winner()
-            if winner:
-                display_message(f"Player {winner} wins!") # Message function now adds restart text
+        # Display Status (Turn or Game Over Message) when it changes
+        status = (game.is_game_over(), game.get_winner(), game.get_current_player())
+        if status != drawn_status:
+            if not game.is_game_over():
+                dirty.append(display_turn(game.get_current_player()))
             else:
-                display_message("It's a Draw!") # Message function now adds restart text
+                # Turn indicator is gone: restore the top margin from the background
+                top_margin = pygame.Rect(0, 0, WIDTH, MARGIN_TOP)
+                screen.blit(background, top_margin, top_margin)
+                dirty.append(top_margin)
+                winner = game.get_winner()
+                if winner:
+                    dirty.append(display_message(f"Player {winner} wins!")) # Message function now adds restart text
+                else:
+                    dirty.append(display_message("It's a Draw!")) # Message function now adds restart text
+            drawn_status = status
 
-        pygame.display.update()
+        pygame.display.update(dirty)
         clock.tick(60)  # Limit frame rate to 60 FPS
 
-
 if __name__ == "__main__":
     main()